@@ -21,11 +21,17 @@ All changes are automatically committed to Git and pushed to GitHub repository.
 No user interaction required - fully automated with complete backup.
 """
 
+import json
+import mmap
+import os
 import re
+import subprocess
 import sys
-from datetime import date, datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
 
 # Import GitHub Backup Manager
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -36,26 +42,127 @@ except ImportError:
 
 # Fix Windows console encoding issues
 if sys.platform.startswith("win"):
-    import codecs
-
     try:
-        sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-        sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+        sys.stdout.reconfigure(encoding="utf-8", errors="strict")
+        sys.stderr.reconfigure(encoding="utf-8", errors="strict")
     except AttributeError:
         # Already properly configured or different Python version
         pass
 
+# Compiled once at import - these patterns are used on every run
+# CURRENT_STATUS.md lines rewritten by the updater, one named group per line
+_STATUS_LINES_RE = re.compile(
+    r"(?P<last_update>\*\*Last Update:\*\* \d{2}/\d{2}/\d{4})"
+    r"|(?P<major>\*\*Major:\*\* [^\n]+)"
+    r"|(?P<progress>\*\*Progress:\*\* Milestone 1: \d+/\d+ tasks completed"
+    r" \(\d+\.\d+%\))"
+    r"|(?P<overall>\*\*Overall:\*\* \d+/\d+ total tasks completed \(\d+\.\d+%\))"
+)
+_TASK_STATUS_RE = re.compile(r"- ([✅⏳🔄]) [🔥🟡🟢]")
+# Same pattern on raw UTF-8 bytes, for counting without decoding the file
+_TASK_STATUS_BYTES_RE = re.compile(
+    b"- ("
+    + b"|".join(status.encode("utf-8") for status in "✅⏳🔄")
+    + b") (?:"
+    + b"|".join(priority.encode("utf-8") for priority in "🔥🟡🟢")
+    + b")"
+)
+_PENDING_TASK_RE = re.compile(r"- ⏳ ([🔥🟡🟢]) (.+)")
+_PY_FILE_RE = re.compile(r"(\w+\.py)")
+# Applied to raw source bytes - identifiers are ASCII, no need to decode the file
+_CLASS_RE = re.compile(rb"class\s+(\w+)")
+_DEF_RE = re.compile(rb"def\s+(\w+)")
+_CLAUDE_VERSION_RE = re.compile(r"\*\*גרסה:\*\* (\d+)\.(\d+)")
+_CLAUDE_UPDATED_RE = re.compile(r"\*\*עודכן אחרון:\*\* \d{2}/\d{2}/\d{4}")
+_NEW_FILES_RE = re.compile(r"\*\*New Files Created:\*\* .+")
+_JUST_COMPLETED_RE = re.compile(r"(\*\*Just Completed:\*\* .+\n)")
+# Non-ASCII runs replaced by safe_print's fallback
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
+# Keywords extract_keywords looks for in pending task text
+_TASK_TYPES = ("יצירת", "עדכון", "התקנת", "בדיקת", "פיתוח", "הקמת", "הגדרת")
+_TECH_KEYWORDS = (
+    "script", "database", "config", "api", "connection", "validation",
+    "testing", "logging", "backup", "github", "status", "reviewer",
+)
+# Commit subjects containing one of these count as session activity
+_COMMIT_KEYWORDS = ("add", "create", "update", "fix", "enhance", "implement")
+# Below this size a plain read is cheaper than setting up an mmap
+_MMAP_MIN_BYTES = 32 * 1024
+# .md files are tens of KB - read/write them in one buffer instead of 8 KiB chunks
+_IO_BUFFER_SIZE = 128 * 1024
+
+# Tasks that might be auto-completed based on script activity
+_AUTO_COMPLETABLE = (
+    ("יצירת Python Status Reviewer script", "project_status_reviewer.py"),
+    ("שיפור מערכת הזיכרון וחיסכון טוקנים", "status"),
+    ("עדכון קבצי תיעוד", ".md"),
+    ("תיקון בעיות קידוד", "encoding"),
+    ("יצירת כלי עזר אוטומטיים", "updater"),
+    ("יצירת מערכת הגדרות", "config"),
+    ("הגדרת פרמטרי חיבור IB", "ib_connector"),
+    ("הגדרת פרמטרי DB", "database"),
+    ("הגדרת logging configuration", "logging"),
+    ("יצירת configuration validation", "config_validator"),
+)
+# desc -> (indicator, casefolded indicator) - folded once at import
+_AUTO_COMPLETABLE_INDICATORS = {
+    desc: (indicator, indicator.casefold()) for desc, indicator in _AUTO_COMPLETABLE
+}
+
+# Config files (milestone 1.4 indicators) -> work category
+_CONFIG_INDICATORS = {
+    "config.yaml": "config",
+    ".env": "config",
+    "ib_connector.py": "ib_connector",
+    "config_manager.py": "database",
+    "logging_setup.py": "logging",
+    "config_validator.py": "config_validator",
+}
+
+# One alternation over all descriptions - TASKS.md is scanned once, not per task.
+# It only finds candidate lines; every description on a line is checked separately
+_STATIC_TASK_RE = re.compile(
+    "- ⏳ ([🔥🟡🟢]) ([^\\n]*(?:"
+    + "|".join(re.escape(desc) for desc, _ in _AUTO_COMPLETABLE)
+    + ")[^\\n]*)"
+)
+
 
 class AutoProjectUpdater:
     def __init__(self):
         """Initialize the auto updater"""
         self.base_path = Path(__file__).parent.parent
         self.md_path = self.base_path / ".md"
+        # Plain string form for os.* calls in the scan loops
+        self._base_str = str(self.base_path)
 
         # Track changes for final summary
         self.changes_made = []
         self.session_activities = []
 
+        # One clock reading per run, so every timestamp written agrees
+        self._now = datetime.now()
+        self._today = self._now.date()
+        self._today_str = self._today.strftime("%d/%m/%Y")
+        self._now_str = self._now.strftime("%d/%m/%Y %H:%M")
+        # Casefolded session activities, built once per task-matching run
+        self._activities_blob = ""
+
+        # File contents read during this run; dirty entries are written by flush()
+        self._cache: Dict[Path, str] = {}
+        self._dirty = set()
+        # Files actually written or appended to on disk during this run
+        self._written = set()
+
+        # Per-directory {file name: mtime}, filled by one scandir per directory
+        self._mtime_cache: Dict[str, Dict[str, float]] = {}
+
+        # Indicators of today's src/ files, shared by task matching and docs
+        self._file_analysis: Optional[Dict[str, List[str]]] = None
+
+        # Pending CURRENT_STATUS.md line replacements, keyed by regex group name
+        self._status_updates: Dict[str, str] = {}
+
         # Files we'll work with
         self.files = {
             "tasks": self.md_path / "TASKS.md",
@@ -68,127 +175,257 @@ class AutoProjectUpdater:
             "files_manual": self.md_path / "FILES_USER_MANUAL.md",
         }
 
+        # Source mtimes and activities from the previous run
+        self.state_file = self.md_path / ".updater_state.json"
+        self._state = self._load_state()
+
+    def _load_state(self) -> Dict:
+        """Load the previous run's state (empty if missing or unreadable)"""
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _unchanged_since_last_run(self, key: str) -> bool:
+        """True if self.files[key] was not modified after the previous run"""
+        if self.files[key] in self._dirty:
+            return False
+        try:
+            mtime = os.path.getmtime(self.files[key])
+        except OSError:
+            return False
+        return mtime <= self._state.get(key, 0)
+
+    def save_state(self) -> bool:
+        """Record source file mtimes so the next run can skip unchanged work"""
+        state = {
+            "activities": self.session_activities,
+            "src_files": self._src_files_modified_today(),
+        }
+        for key in ("tasks", "current_status"):
+            try:
+                state[key] = os.path.getmtime(self.files[key])
+            except OSError:
+                pass
+        try:
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            return True
+        except OSError as e:
+            self.safe_print(f"❌ Error writing {self.state_file}: {e}")
+            return False
+
     def safe_print(self, text):
         """Print text safely handling encoding issues"""
         try:
             print(text)
         except UnicodeEncodeError:
-            clean_text = re.sub(r"[^\x00-\x7F]+", "?", text)
+            clean_text = _NON_ASCII_RE.sub("?", text)
             print(clean_text)
 
     def read_file_safe(self, filepath: Path) -> str:
-        """Safely read a file with UTF-8 encoding"""
+        """Safely read a file with UTF-8 encoding (cached for this run)"""
+        if filepath in self._cache:
+            return self._cache[filepath]
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return f.read()
+            with open(filepath, "r", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                content = f.read()
         except FileNotFoundError:
             return ""
         except Exception as e:
             self.safe_print(f"❌ Error reading {filepath}: {e}")
             return ""
+        self._cache[filepath] = content
+        return content
+
+    def read_bytes_safe(self, filepath: Path) -> bytes:
+        """Safely read a file's raw bytes (not cached, no decoding)"""
+        try:
+            with open(filepath, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                return f.read()
+        except FileNotFoundError:
+            return b""
+        except Exception as e:
+            self.safe_print(f"❌ Error reading {filepath}: {e}")
+            return b""
 
     def write_file_safe(self, filepath: Path, content: str) -> bool:
-        """Safely write a file with UTF-8 encoding"""
+        """Safely write a file with UTF-8 encoding (atomic via temp file + rename)"""
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
                 f.write(content)
-            return True
+            os.replace(tmp_path, filepath)
         except Exception as e:
             self.safe_print(f"❌ Error writing {filepath}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False
+        self._cache[filepath] = content
+        self._dirty.discard(filepath)
+        self._written.add(filepath)
+        return True
+
+    def append_file_safe(self, filepath: Path, content: str) -> bool:
+        """Safely append to a file with UTF-8 encoding"""
+        try:
+            with open(filepath, "a", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                f.write(content)
+        except Exception as e:
+            self.safe_print(f"❌ Error appending to {filepath}: {e}")
+            return False
+        # Any cached copy is now stale
+        self._cache.pop(filepath, None)
+        self._written.add(filepath)
+        return True
+
+    def mark_dirty(self, filepath: Path, content: str):
+        """Update the cached content of a file; written to disk by flush()"""
+        self._cache[filepath] = content
+        self._dirty.add(filepath)
+
+    def _apply_status_updates(self):
+        """Apply all pending CURRENT_STATUS.md line updates in a single scan"""
+        if not self._status_updates:
+            return
+        current_status = self.read_file_safe(self.files["current_status"])
+        if current_status:
+            updates = self._status_updates
+            updated_status = _STATUS_LINES_RE.sub(
+                lambda m: updates.get(m.lastgroup, m.group(0)), current_status
+            )
+            self.mark_dirty(self.files["current_status"], updated_status)
+        self._status_updates = {}
+
+    def flush(self) -> bool:
+        """Write all files modified in the cache to disk"""
+        self._apply_status_updates()
+        success = True
+        for filepath in sorted(self._dirty):
+            if not self.write_file_safe(filepath, self._cache[filepath]):
+                success = False
+        return success
 
     def analyze_git_commits(self) -> List[str]:
         """ניתוח commit messages לזיהוי פעילויות"""
         activities = []
         try:
-            import subprocess
-            import os
-
-            # Change to project directory
-            original_dir = os.getcwd()
-            os.chdir(self.base_path)
-
-            # Get last 5 commits from today
-            today_str = date.today().strftime("%Y-%m-%d")
-            result = subprocess.run([
-                'git', 'log', '--oneline', '--since', today_str, '-n', '5'
-            ], capture_output=True, text=True, check=True)
-
-            if result.stdout.strip():
-                commits = result.stdout.strip().split('\n')
-                for commit in commits:
-                    if commit.strip():
-                        # Extract meaningful info from commit message
-                        commit_msg = commit.split(' ', 1)[1] if ' ' in commit else commit
-                        if any(keyword in commit_msg.lower() for keyword in
-                               ['add', 'create', 'update', 'fix', 'enhance', 'implement']):
-                            activities.append(f"Git: {commit_msg[:60]}")
-
-            os.chdir(original_dir)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Git not available or no commits today
+            # Subjects of today's last 5 non-merge commits, one per line
+            # (%s is the subject line only, so it never spans lines)
+            today_str = self._today.isoformat()
+            with subprocess.Popen(
+                [
+                    "git", "log", "--no-merges", "--pretty=format:%s",
+                    "--since", today_str, "-n", "5",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                cwd=self.base_path,
+            ) as proc:
+                for line in proc.stdout:
+                    commit_msg = line.strip()
+                    if not commit_msg:
+                        continue
+                    # Keep commits whose subject describes actual work
+                    commit_lower = commit_msg.lower()
+                    if any(keyword in commit_lower for keyword in _COMMIT_KEYWORDS):
+                        activities.append(f"Git: {commit_msg[:60]}")
+                        if len(activities) == 3:
+                            break  # Limit to 3 most recent - stop reading git
+        except OSError:
+            # Git not available
             pass
-        except Exception:
+
+        return activities
+
+    def _scan_mtimes(self, name: str) -> Dict[str, float]:
+        """Map file name -> mtime for one project directory (scanned once per run)"""
+        mtimes = self._mtime_cache.get(name)
+        if mtimes is not None:
+            return mtimes
+
+        mtimes = {}
+        try:
+            with os.scandir(os.path.join(self._base_str, name)) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            mtimes[entry.name] = entry.stat().st_mtime
+                    except OSError:
+                        pass
+        except OSError:
             pass
+        self._mtime_cache[name] = mtimes
+        return mtimes
+
+    def _today_bounds(self) -> Tuple[float, float]:
+        """Today's [start, end) as epoch seconds, for comparing raw st_mtime"""
+        midnight = datetime.combine(self._today, datetime.min.time())
+        return midnight.timestamp(), (midnight + timedelta(days=1)).timestamp()
+
+    def _py_files_modified_today(self, name: str) -> List[str]:
+        """Names of *.py files in a project directory modified today"""
+        day_start, day_end = self._today_bounds()
+        return [
+            filename
+            for filename, mtime in self._scan_mtimes(name).items()
+            if filename.endswith(".py") and day_start <= mtime < day_end
+        ]
 
-        return activities[:3]  # Limit to 3 most recent
+    def _src_files_modified_today(self) -> List[str]:
+        """Sorted src/*.py files modified today - the files dynamic matching uses"""
+        return sorted(self._py_files_modified_today("src"))
 
     def detect_session_activities(self) -> List[str]:
-        """Auto-detect what was done in this session - ENHANCED"""
+        """Auto-detect what was done in this session - ENHANCED (once per run)"""
+        if self.session_activities:
+            return self.session_activities
+
         activities = []
 
-        # Phase 1: Git analysis (NEW)
-        git_activities = self.analyze_git_commits()
-        activities.extend(git_activities)
+        # Phase 1: Git analysis (NEW) - git log runs in the background while
+        # Phase 2 lists the directories; both mostly wait on the OS
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            git_future = executor.submit(self.analyze_git_commits)
 
-        # Phase 2: File modification analysis (ENHANCED)
-        py_dirs = [self.base_path / ".py", self.base_path / "src"]
-        today = date.today()
+            # Phase 2: File modification analysis - each directory is read once
+            dir_mtimes = {
+                name: self._scan_mtimes(name)
+                for name in (".py", "src", "config", ".md")
+            }
 
-        for py_dir in py_dirs:
-            if py_dir.exists():
-                for py_file in py_dir.glob("*.py"):
-                    try:
-                        mod_time = datetime.fromtimestamp(
-                            py_file.stat().st_mtime
-                        ).date()
-                        if mod_time == today:
-                            activities.append(f"עדכן/יצר סקריפט: {py_file.name}")
-                    except OSError:
-                        pass
+            activities.extend(git_future.result())
 
-        # Check for config files (milestone 1.4 indicators)
-        config_indicators = {
-            "config": ["config.yaml", ".env"],
-            "ib_connector": ["ib_connector.py"],
-            "database": ["config_manager.py"],
-            "logging": ["logging_setup.py"],
-            "config_validator": ["config_validator.py"],
-        }
+        # Today's bounds as epoch seconds - compare raw st_mtime floats per file
+        day_start, day_end = self._today_bounds()
+
+        # (directory, file name, activity) candidates in report order
+        candidates = [
+            (py_dir, filename, f"עדכן/יצר סקריפט: {filename}")
+            for py_dir in (".py", "src")
+            for filename in dir_mtimes[py_dir]
+            if filename.endswith(".py")
+        ]
+        candidates.extend(
+            (search_dir, filename, f"עבודה על {category}: {filename}")
+            for filename, category in _CONFIG_INDICATORS.items()
+            for search_dir in ("config", "src")
+        )
+        candidates.extend(
+            (".md", filepath.name, f"עדכן קובץ תיעוד: {filepath.name}")
+            for filepath in self.files.values()
+        )
 
-        for category, files in config_indicators.items():
-            for filename in files:
-                for search_dir in [self.base_path / "config", self.base_path / "src"]:
-                    filepath = search_dir / filename
-                    if filepath.exists():
-                        try:
-                            mod_time = datetime.fromtimestamp(
-                                filepath.stat().st_mtime
-                            ).date()
-                            if mod_time == today:
-                                activities.append(f"עבודה על {category}: {filename}")
-                        except OSError:
-                            pass
-
-        # Check for recent changes in .md files
-        for name, filepath in self.files.items():
-            if filepath.exists():
-                try:
-                    mod_time = datetime.fromtimestamp(filepath.stat().st_mtime).date()
-                    if mod_time == today:
-                        activities.append(f"עדכן קובץ תיעוד: {filepath.name}")
-                except OSError:
-                    pass
+        for directory, filename, activity in candidates:
+            mtime = dir_mtimes[directory].get(filename)
+            if mtime is not None and day_start <= mtime < day_end:
+                activities.append(activity)
 
         # If no specific activities detected, add generic ones
         if not activities:
@@ -198,91 +435,83 @@ class AutoProjectUpdater:
                 "תחזוקה ועדכון מערכת התיעוד",
             ]
 
-        return activities[:3]  # Limit to 3 main activities
+        self.session_activities = activities[:3]  # Limit to 3 main activities
+        return self.session_activities
 
     def analyze_file_contents_for_tasks(self) -> Dict[str, List[str]]:
-        """ניתוח תוכן קבצים לזיהוי משימות שהושלמו"""
+        """ניתוח תוכן קבצים לזיהוי משימות שהושלמו (פעם אחת בריצה)"""
+        if self._file_analysis is not None:
+            return self._file_analysis
+
         file_analysis = {}
 
         # Analyze Python files created/modified today
         src_dir = self.base_path / "src"
-        if src_dir.exists():
-            today = date.today()
-            for py_file in src_dir.glob("*.py"):
-                try:
-                    mod_time = datetime.fromtimestamp(py_file.stat().st_mtime).date()
-                    if mod_time == today:
-                        # Try to extract docstring and key functions
-                        content = self.read_file_safe(py_file)
-                        if content:
-                            # Extract main functionality indicators
-                            indicators = []
-                            if 'class' in content.lower():
-                                classes = re.findall(r'class\s+(\w+)', content)
-                                indicators.extend([f"class {cls}" for cls in classes[:3]])
-                            if 'def' in content.lower():
-                                functions = re.findall(r'def\s+(\w+)', content)
-                                main_functions = [f for f in functions if not f.startswith('_')][:3]
-                                indicators.extend([f"function {func}" for func in main_functions])
-
-                            file_analysis[py_file.name] = indicators
-                except OSError:
-                    pass
+        for filename in self._py_files_modified_today("src"):
+            # Try to extract docstring and key functions
+            content = self.read_bytes_safe(src_dir / filename)
+            if content:
+                # Extract main functionality indicators - findall() is already
+                # cheap on files without matches, no lowercased copy needed
+                classes = _CLASS_RE.findall(content)[:3]
+                indicators = [f"class {cls.decode('ascii')}" for cls in classes]
+                functions = _DEF_RE.findall(content)
+                main_functions = [f for f in functions if not f.startswith(b'_')][:3]
+                indicators.extend(
+                    [f"function {func.decode('ascii')}" for func in main_functions]
+                )
+
+                file_analysis[filename] = indicators
 
+        self._file_analysis = file_analysis
         return file_analysis
 
     def extract_keywords(self, text: str) -> List[str]:
         """חילוץ מילות מפתח מטקסט משימה"""
-        keywords = []
         text_lower = text.lower()
 
-        # Task type keywords
-        task_types = ['יצירת', 'עדכון', 'התקנת', 'בדיקת', 'פיתוח', 'הקמת', 'הגדרת']
-        for task_type in task_types:
-            if task_type in text_lower:
-                keywords.append(task_type)
-
-        # Technical keywords
-        tech_keywords = ['script', 'database', 'config', 'api', 'connection', 'validation',
-                        'testing', 'logging', 'backup', 'github', 'status', 'reviewer']
-        for keyword in tech_keywords:
-            if keyword in text_lower:
-                keywords.append(keyword)
+        # Task type and technical keywords
+        keywords = [task_type for task_type in _TASK_TYPES if task_type in text_lower]
+        keywords += [keyword for keyword in _TECH_KEYWORDS if keyword in text_lower]
 
         # Extract file names mentioned
-        file_patterns = re.findall(r'(\w+\.py)', text)
+        file_patterns = _PY_FILE_RE.findall(text)
         keywords.extend(file_patterns)
 
         return keywords
 
     def calculate_match_score(self, task_keywords: List[str], activity: str) -> int:
         """חישוב ציון התאמה בין משימה לפעילות"""
-        if not task_keywords:
-            return 0
+        return self._match_score(
+            [keyword.lower() for keyword in task_keywords], activity.lower()
+        )
 
-        activity_lower = activity.lower()
-        matches = 0
+    @staticmethod
+    def _match_score(keywords_lower: List[str], activity_lower: str) -> int:
+        """Percentage of already-lowercased keywords found in a lowercased activity"""
+        if not keywords_lower:
+            return 0
 
-        for keyword in task_keywords:
-            if keyword.lower() in activity_lower:
-                matches += 1
+        matches = sum(1 for keyword in keywords_lower if keyword in activity_lower)
 
         # Calculate percentage match
-        score = int((matches / len(task_keywords)) * 100)
-        return score
+        return int((matches / len(keywords_lower)) * 100)
 
     def dynamic_task_matching(self, tasks_content: str) -> List[tuple]:
         """התאמה דינמית של פעילויות למשימות פתוחות"""
         matches = []
 
         # Find all pending tasks
-        pending_pattern = r"- ⏳ ([🔥🟡🟢]) (.+)"
-        pending_tasks = re.findall(pending_pattern, tasks_content)
+        pending_tasks = _PENDING_TASK_RE.findall(tasks_content)
 
         # Combine all session activities
         all_activities = self.session_activities + [
             f"קובץ: {filename}" for filename in self.analyze_file_contents_for_tasks().keys()
         ]
+        # Lowercase each activity once, not once per task
+        activities_lower = [
+            (activity, activity.lower()) for activity in all_activities
+        ]
 
         # For each pending task, calculate match score
         for priority, task_text in pending_tasks:
@@ -290,14 +519,20 @@ class AutoProjectUpdater:
             best_activity = None
 
             # Create keywords from task
-            task_keywords = self.extract_keywords(task_text)
+            task_keywords = [
+                keyword.lower() for keyword in self.extract_keywords(task_text)
+            ]
+            if not task_keywords:
+                continue  # Nothing to match on - every score would be 0
 
             # Check against all activities
-            for activity in all_activities:
-                score = self.calculate_match_score(task_keywords, activity)
+            for activity, activity_lower in activities_lower:
+                score = self._match_score(task_keywords, activity_lower)
                 if score > best_score:
                     best_score = score
                     best_activity = activity
+                    if best_score >= 100:
+                        break  # Perfect match - no later activity can beat it
 
             # If score is high enough, consider it a match
             if best_score >= 75:  # 75% threshold
@@ -309,81 +544,121 @@ class AutoProjectUpdater:
         """Automatically mark tasks as completed - ENHANCED VERSION"""
         self.safe_print("📋 זיהוי אוטומטי מתקדם של משימות שהושלמו...")
 
+        # Same TASKS.md, activities and modified src files as last run -
+        # nothing new to match
+        if (
+            self._unchanged_since_last_run("tasks")
+            and self.session_activities == self._state.get("activities")
+            and self._src_files_modified_today() == self._state.get("src_files")
+        ):
+            self.safe_print("  ℹ️  TASKS.md לא השתנה מאז הריצה הקודמת")
+            return True
+
         tasks_content = self.read_file_safe(self.files["tasks"])
         if not tasks_content:
             return False
 
-        # Phase 1: Static mapping (existing logic)
-        static_matches = self._static_task_mapping(tasks_content)
+        self._activities_blob = "\n".join(
+            activity.casefold() for activity in self.session_activities
+        )
+
+        # Phase 1: Static mapping - marks matching tasks in a single pass
+        updated_content, static_matches = self._static_task_mapping(tasks_content)
+        tasks_completed = len(static_matches)
+        for priority, task_text, activity, score in static_matches:
+            self.safe_print(
+                f"  ✅ הושלם: {task_text[:50]}... (מבוסס על: {activity[:30]})"
+            )
 
         # Phase 2: Dynamic matching (NEW)
-        dynamic_matches = self.dynamic_task_matching(tasks_content)
+        dynamic_matches = self.dynamic_task_matching(updated_content)
+
+        # Apply dynamic matches - one pass over the file for all of them
+        replacements = {}
+        for priority, task_text, activity, score in dynamic_matches:
+            old_line = f"- ⏳ {priority} {task_text}"
+            if old_line not in replacements:
+                replacements[old_line] = (
+                    f"- ✅ {priority} {task_text}", task_text, activity
+                )
 
-        # Combine all matches
-        all_matches = static_matches + dynamic_matches
+        if replacements:
+            applied = set()
 
-        updated_content = tasks_content
-        tasks_completed = 0
+            def _repl(line_match):
+                old_line = line_match.group(0)
+                applied.add(old_line)
+                return replacements[old_line][0]
 
-        # Apply all matches
-        for priority, task_text, activity, score in all_matches:
-            old_line = f"- ⏳ {priority} {task_text}"
-            new_line = f"- ✅ {priority} {task_text}"
+            # Longest first, so a task whose text extends another's wins
+            dynamic_re = re.compile(
+                "|".join(
+                    re.escape(old_line)
+                    for old_line in sorted(replacements, key=len, reverse=True)
+                )
+            )
+            updated_content = dynamic_re.sub(_repl, updated_content)
 
-            if old_line in updated_content:
-                updated_content = updated_content.replace(old_line, new_line)
-                tasks_completed += 1
-                activity_note = f" (מבוסס על: {activity[:30]})" if activity else ""
-                self.safe_print(f"  ✅ הושלם: {task_text[:50]}...{activity_note}")
+            for old_line, (_, task_text, activity) in replacements.items():
+                if old_line in applied:
+                    tasks_completed += 1
+                    activity_note = f" (מבוסס על: {activity[:30]})" if activity else ""
+                    self.safe_print(f"  ✅ הושלם: {task_text[:50]}...{activity_note}")
 
         # Save updated tasks if any changes
         if tasks_completed > 0:
-            if self.write_file_safe(self.files["tasks"], updated_content):
-                self.changes_made.append(
-                    f"זוהו וסומנו {tasks_completed} משימות אוטומטית (חכם + סטטי)"
-                )
-                return True
+            self.mark_dirty(self.files["tasks"], updated_content)
+            self.changes_made.append(
+                f"זוהו וסומנו {tasks_completed} משימות אוטומטית (חכם + סטטי)"
+            )
+            return True
 
         self.safe_print("  ℹ️  לא נמצאו משימות לעדכון אוטומטי")
         return True
 
-    def _static_task_mapping(self, tasks_content: str) -> List[tuple]:
-        """מיפוי סטטי של משימות (הלוגיקה הקיימת)"""
+    def _static_task_mapping(self, tasks_content: str) -> Tuple[str, List[tuple]]:
+        """מיפוי סטטי של משימות - מחזיר תוכן מעודכן ורשימת התאמות"""
         matches = []
+        seen = set()  # descriptions whose first pending line was already checked
+        completed = {}  # pending line -> completed line
+
+        for task_match in _STATIC_TASK_RE.finditer(tasks_content):
+            priority = task_match.group(1)
+            full_task = task_match.group(2)
+
+            # Only the first pending line holding a description is checked for it
+            indicator = None
+            for order, (desc, _) in enumerate(_AUTO_COMPLETABLE):
+                if desc in seen or desc not in full_task:
+                    continue
+                seen.add(desc)
+                desc_indicator, indicator_folded = _AUTO_COMPLETABLE_INDICATORS[desc]
+                # Check if indicator appears in session activities
+                if indicator is None and indicator_folded in self._activities_blob:
+                    indicator = desc_indicator
+                    indicator_order = order
+
+            if indicator is not None:
+                completed[task_match.group(0)] = f"- ✅ {priority} {full_task}"
+                matches.append(
+                    (indicator_order, (priority, full_task, f"static:{indicator}", 100))
+                )
 
-        # Tasks that might be auto-completed based on script activity
-        auto_completable = [
-            ("יצירת Python Status Reviewer script", "project_status_reviewer.py"),
-            ("שיפור מערכת הזיכרון וחיסכון טוקנים", "status"),
-            ("עדכון קבצי תיעוד", ".md"),
-            ("תיקון בעיות קידוד", "encoding"),
-            ("יצירת כלי עזר אוטומטיים", "updater"),
-            ("יצירת מערכת הגדרות", "config"),
-            ("הגדרת פרמטרי חיבור IB", "ib_connector"),
-            ("הגדרת פרמטרי DB", "database"),
-            ("הגדרת logging configuration", "logging"),
-            ("יצירת configuration validation", "config_validator"),
-        ]
+        # Report matches in _AUTO_COMPLETABLE order, as the per-description search did
+        matches = [match for _, match in sorted(matches, key=lambda item: item[0])]
+        if not completed:
+            return tasks_content, matches
 
-        # Check which tasks can be marked as completed
-        for task_desc, indicator in auto_completable:
-            # Look for this task in pending state
-            pattern = f"- ⏳ ([🔥🟡🟢]) ([^\\n]*{re.escape(task_desc)}[^\\n]*)"
-            task_match = re.search(pattern, tasks_content)
-
-            # Check if indicator appears in session activities
-            indicator_found = indicator.lower() in str(
-                self.session_activities
-            ).lower() or any(
-                indicator in activity.lower() for activity in self.session_activities
+        # Mark every occurrence of the completed lines in one pass, longest first
+        completed_re = re.compile(
+            "|".join(
+                re.escape(line) for line in sorted(completed, key=len, reverse=True)
             )
-
-            if task_match and indicator_found:
-                priority = task_match.group(1)
-                full_task = task_match.group(2)
-                matches.append((priority, full_task, f"static:{indicator}", 100))
-
-        return matches
+        )
+        updated_content = completed_re.sub(
+            lambda line_match: completed[line_match.group(0)], tasks_content
+        )
+        return updated_content, matches
 
     def dynamic_content_update(self) -> bool:
         """עדכון דינמי של תוכן קבצים לפי שינויים"""
@@ -412,37 +687,25 @@ class AutoProjectUpdater:
                 return False
 
             # Check if new Python files were added today
-            new_files = []
-            src_dir = self.base_path / "src"
-            if src_dir.exists():
-                today = date.today()
-                for py_file in src_dir.glob("*.py"):
-                    try:
-                        mod_time = datetime.fromtimestamp(py_file.stat().st_mtime).date()
-                        if mod_time == today:
-                            new_files.append(py_file.name)
-                    except OSError:
-                        pass
+            new_files = self._py_files_modified_today("src")
 
             if new_files:
                 # Update the version number
-                claude_content = re.sub(
-                    r'\*\*גרסה:\*\* (\d+)\.(\d+)',
+                claude_content = _CLAUDE_VERSION_RE.sub(
                     lambda m: f"**גרסה:** {m.group(1)}.{int(m.group(2)) + 1}",
                     claude_content
                 )
 
                 # Update last updated date
-                today_str = date.today().strftime("%d/%m/%Y")
-                claude_content = re.sub(
-                    r'\*\*עודכן אחרון:\*\* \d{2}/\d{2}/\d{4}',
+                today_str = self._today_str
+                claude_content = _CLAUDE_UPDATED_RE.sub(
                     f"**עודכן אחרון:** {today_str}",
                     claude_content
                 )
 
-                if self.write_file_safe(self.files["claude"], claude_content):
-                    self.safe_print(f"  ✅ עודכן CLAUDE.md עם {len(new_files)} קבצים חדשים")
-                    return True
+                self.mark_dirty(self.files["claude"], claude_content)
+                self.safe_print(f"  ✅ עודכן CLAUDE.md עם {len(new_files)} קבצים חדשים")
+                return True
 
         except Exception as e:
             self.safe_print(f"  ❌ שגיאה בעדכון CLAUDE.md: {e}")
@@ -459,27 +722,25 @@ class AutoProjectUpdater:
             # Update "New Files Created" section if there are new Python files
             file_analysis = self.analyze_file_contents_for_tasks()
             if file_analysis:
-                today_str = date.today().strftime("%d/%m/%Y")
+                today_str = self._today_str
                 new_files_text = f"**New Files Created:** {', '.join(file_analysis.keys())} ({today_str})"
 
                 # Try to update existing "New Files Created" line or add it
                 if "**New Files Created:**" in current_status:
-                    current_status = re.sub(
-                        r'\*\*New Files Created:\*\* .+',
+                    current_status = _NEW_FILES_RE.sub(
                         new_files_text,
                         current_status
                     )
                 else:
                     # Add after "Just Completed" line
-                    current_status = re.sub(
-                        r'(\*\*Just Completed:\*\* .+\n)',
+                    current_status = _JUST_COMPLETED_RE.sub(
                         r'\1' + new_files_text + '\n',
                         current_status
                     )
 
-                if self.write_file_safe(self.files["current_status"], current_status):
-                    self.safe_print(f"  ✅ עודכן CURRENT_STATUS.md עם קבצים חדשים")
-                    return True
+                self.mark_dirty(self.files["current_status"], current_status)
+                self.safe_print(f"  ✅ עודכן CURRENT_STATUS.md עם קבצים חדשים")
+                return True
 
         except Exception as e:
             self.safe_print(f"  ❌ שגיאה בעדכון CURRENT_STATUS.md: {e}")
@@ -494,90 +755,114 @@ class AutoProjectUpdater:
         if not current_status:
             return False
 
-        today = date.today().strftime("%d/%m/%Y")
-        updated_content = current_status
+        today = self._today_str
 
         # Update last update date
-        updated_content = re.sub(
-            r"\*\*Last Update:\*\* \d{2}/\d{2}/\d{4}",
-            f"**Last Update:** {today}",
-            updated_content,
-        )
+        self._status_updates["last_update"] = f"**Last Update:** {today}"
 
         # Update system changes section if there were changes
         if self.changes_made:
-            # Find the system changes section
-            changes_text = "**Major:** " + ", ".join(self.changes_made[:2])
-            updated_content = re.sub(
-                r"\*\*Major:\*\* .+", changes_text, updated_content
+            self._status_updates["major"] = "**Major:** " + ", ".join(
+                self.changes_made[:2]
             )
 
-        if self.write_file_safe(self.files["current_status"], updated_content):
-            self.changes_made.append("עודכן CURRENT_STATUS.md עם תאריך נוכחי")
-            self.safe_print("  ✅ CURRENT_STATUS.md עודכן")
-            return True
-
-        return False
+        self.changes_made.append("עודכן CURRENT_STATUS.md עם תאריך נוכחי")
+        self.safe_print("  ✅ CURRENT_STATUS.md עודכן")
+        return True
 
     def create_auto_session_summary(self) -> bool:
         """Automatically create and archive session summary"""
         self.safe_print("📝 יצירת סיכום סשן אוטומטי...")
 
-        # Get session activities
+        # Get session activities (already detected earlier in the run)
         activities = self.detect_session_activities()
-        self.session_activities = activities
 
         if not activities and not self.changes_made:
             self.safe_print("  ℹ️  לא נמצא תוכן לסיכום")
             return True
 
         # Create session summary
-        today = date.today().strftime("%d/%m/%Y")
-        session_summary = f"### Session {today}\n\n"
-        session_summary += "**Main Accomplishments:**\n"
+        today = self._today_str
+        parts = [f"### Session {today}\n\n", "**Main Accomplishments:**\n"]
 
         # Add detected activities
-        for activity in activities:
-            session_summary += f"- {activity}\n"
+        parts.extend(f"- {activity}\n" for activity in activities)
 
         # Add system changes
         if self.changes_made:
-            session_summary += "\n**System Changes:**\n"
-            for change in self.changes_made:
-                session_summary += f"- {change}\n"
+            parts.append("\n**System Changes:**\n")
+            parts.extend(f"- {change}\n" for change in self.changes_made)
 
-        session_summary += f"\n**Date:** {datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
-        session_summary += "---\n\n"
+        parts.append(f"\n**Date:** {self._now_str}\n")
+        parts.append("---\n\n")
+        session_summary = "".join(parts)
 
-        # Archive to SESSION_ARCHIVE.md
-        session_archive_content = self.read_file_safe(self.files["session_archive"])
-        session_archive_content = session_archive_content + session_summary
-
-        if self.write_file_safe(self.files["session_archive"], session_archive_content):
+        # Archive to SESSION_ARCHIVE.md - append only, no need to re-read it
+        if self.append_file_safe(self.files["session_archive"], session_summary):
             self.safe_print("  ✅ סיכום סשן נשמר בארכיב")
             self.changes_made.append("עודכן ארכיב סשנים")
             return True
 
         return False
 
+    def _count_task_states(self) -> Optional[Counter]:
+        """Tally TASKS.md status markers; None if the file is missing or empty"""
+        filepath = self.files["tasks"]
+
+        # Already decoded earlier in this run - count on the cached text
+        if filepath in self._cache:
+            tasks_content = self._cache[filepath]
+            if not tasks_content:
+                return None
+            return Counter(_TASK_STATUS_RE.findall(tasks_content))
+
+        # Not read yet - count on raw bytes, only the matched markers get decoded
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            return None
+        if not size:
+            return None
+
+        statuses = None
+        if size >= _MMAP_MIN_BYTES:
+            try:
+                with open(filepath, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    statuses = _TASK_STATUS_BYTES_RE.findall(mm)
+            except (OSError, ValueError):
+                pass  # Fall back to a plain read below
+
+        if statuses is None:
+            tasks_bytes = self.read_bytes_safe(filepath)
+            if not tasks_bytes:
+                return None
+            statuses = _TASK_STATUS_BYTES_RE.findall(tasks_bytes)
+
+        return Counter(status.decode("utf-8") for status in statuses)
+
     def update_task_statistics(self) -> bool:
         """Update task statistics in CURRENT_STATUS.md"""
         self.safe_print("📈 עדכון סטטיסטיקות משימות...")
 
-        tasks_content = self.read_file_safe(self.files["tasks"])
-        if not tasks_content:
-            return False
+        # Counts were already written by the previous run
+        if self._unchanged_since_last_run("tasks") and self._unchanged_since_last_run(
+            "current_status"
+        ):
+            self.safe_print("  ℹ️  TASKS.md לא השתנה מאז הריצה הקודמת")
+            return True
 
-        # Count tasks
-        completed_tasks = len(re.findall(r"- ✅ [🔥🟡🟢]", tasks_content))
-        pending_tasks = len(re.findall(r"- ⏳ [🔥🟡🟢]", tasks_content))
-        in_progress_tasks = len(re.findall(r"- 🔄 [🔥🟡🟢]", tasks_content))
+        # Count tasks - one scan tallies all three states
+        status_counts = self._count_task_states()
+        if status_counts is None:
+            return False
+        completed_tasks = status_counts["✅"]
+        pending_tasks = status_counts["⏳"]
+        in_progress_tasks = status_counts["🔄"]
 
         total_tasks = completed_tasks + pending_tasks + in_progress_tasks
 
-        # Update CURRENT_STATUS.md with new numbers
-        current_status = self.read_file_safe(self.files["current_status"])
-
         # Update progress line
         milestone1_completed = (
             completed_tasks  # Assuming most completed are from milestone 1
@@ -602,23 +887,12 @@ class AutoProjectUpdater:
             f"total tasks completed ({overall_percent:.1f}%)"
         )
 
-        updated_status = re.sub(
-            r"\*\*Progress:\*\* Milestone 1: \d+/\d+ tasks completed \(\d+\.\d+%\)",
-            progress_line,
-            current_status,
-        )
-
-        updated_status = re.sub(
-            r"\*\*Overall:\*\* \d+/\d+ total tasks completed \(\d+\.\d+%\)",
-            overall_line,
-            updated_status,
-        )
-
-        if self.write_file_safe(self.files["current_status"], updated_status):
-            self.safe_print(f"  ✅ עודכן: {completed_tasks} הושלמו מתוך {total_tasks}")
-            return True
+        # Applied to CURRENT_STATUS.md together with the other line updates
+        self._status_updates["progress"] = progress_line
+        self._status_updates["overall"] = overall_line
 
-        return False
+        self.safe_print(f"  ✅ עודכן: {completed_tasks} הושלמו מתוך {total_tasks}")
+        return True
 
     def backup_to_github(self) -> bool:
         """
@@ -650,25 +924,26 @@ class AutoProjectUpdater:
 
     def _perform_git_backup(self) -> bool:
         """Perform full Git commit and push"""
-        import subprocess
-        import os
+        # Every git call runs in the project root without changing our own cwd
+        cwd = self.base_path
 
         try:
-            os.chdir(self.base_path)
-
-            # Check if there are any changes to commit
-            result = subprocess.run(['git', 'status', '--porcelain'],
-                                  capture_output=True, text=True, check=True)
-
-            if not result.stdout.strip():
-                self.safe_print("  ℹ️  אין שינויים לגיבוי Git")
-                return True
+            # This run wrote files, so there is something to commit; otherwise
+            # ask git - read-only, so don't let it take the index lock
+            if not self._written:
+                result = subprocess.run(['git', 'status', '--porcelain'],
+                                      capture_output=True, text=True, check=True, cwd=cwd,
+                                      env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"})
+
+                if not result.stdout.strip():
+                    self.safe_print("  ℹ️  אין שינויים לגיבוי Git")
+                    return True
 
             # Add all changes
-            subprocess.run(['git', 'add', '.'], check=True)
+            subprocess.run(['git', 'add', '.'], check=True, cwd=cwd)
 
             # Create commit message
-            now = datetime.now().strftime("%d/%m/%Y %H:%M")
+            now = self._now_str
             commit_msg = f"""Automatic project update - {now}
 
 Auto-updated by project_updater.py:
@@ -682,10 +957,10 @@ Auto-updated by project_updater.py:
 Co-Authored-By: Claude <noreply@anthropic.com>"""
 
             # Commit changes
-            subprocess.run(['git', 'commit', '-m', commit_msg], check=True)
+            subprocess.run(['git', 'commit', '-m', commit_msg], check=True, cwd=cwd)
 
             # Push to GitHub
-            subprocess.run(['git', 'push'], check=True)
+            subprocess.run(['git', 'push'], check=True, cwd=cwd)
 
             return True
 
@@ -738,7 +1013,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
                 self.safe_print("\n🔄 יוצר גיבוי אוטומטי לגיטהאב...")
                 backup_manager = GitHubBackupManager()
                 result = backup_manager.create_automated_backup(
-                    f"Auto backup - {datetime.now().strftime('%d/%m/%Y %H:%M')}"
+                    f"Auto backup - {self._now_str}"
                 )
                 if result.get("success"):
                     self.safe_print("   ✅ גיבוי לגיטהאב הושלם בהצלחה")
@@ -753,7 +1028,7 @@ Co-Authored-By: Claude <noreply@anthropic.com>"""
         self.safe_print("   ✅ גיבוי אוטומטי לגיטהאב פועל")
 
         self.safe_print(
-            f"\n📅 עדכון אוטומטי הושלם: {datetime.now().strftime('%d/%m/%Y %H:%M')}"
+            f"\n📅 עדכון אוטומטי הושלם: {self._now_str}"
         )
         self.safe_print("=" * 60)
 
@@ -775,23 +1050,29 @@ def main():
         updater.safe_print("=" * 50)
         updater.safe_print("עדכון אוטומטי של מצב הפרויקט...\n")
 
-        # Execute auto-update sequence
-        steps = [
-            ("זיהוי פעילויות סשן", lambda: updater.detect_session_activities()),
-            ("עדכון משימות שהושלמו", updater.auto_mark_completed_tasks),
-            ("עדכון דינמי של תוכן קבצים", updater.dynamic_content_update),
-            ("עדכון סטטיסטיקות משימות", updater.update_task_statistics),
-            ("עדכון מצב נוכחי", updater.update_current_status_auto),
-            ("יצירת וארכוב סיכום סשן", updater.create_auto_session_summary),
-            ("גיבוי מלא של הפרויקט ל-GitHub", updater.backup_to_github),
-        ]
-
-        for step_name, step_func in steps:
+        def _safe_step(step_name, step_func):
             updater.safe_print(f"🔄 {step_name}...")
             try:
-                step_func()
+                return step_func()
             except Exception as e:
                 updater.safe_print(f"❌ שגיאה ב{step_name}: {e}")
+                return None
+
+        # Execute auto-update sequence - detection runs first and is memoized,
+        # so every later step reuses the same session activities
+        _safe_step("זיהוי פעילויות סשן", updater.detect_session_activities)
+        _safe_step("עדכון משימות שהושלמו", updater.auto_mark_completed_tasks)
+        _safe_step("עדכון דינמי של תוכן קבצים", updater.dynamic_content_update)
+        _safe_step("עדכון סטטיסטיקות משימות", updater.update_task_statistics)
+        _safe_step("עדכון מצב נוכחי", updater.update_current_status_auto)
+        _safe_step("יצירת וארכוב סיכום סשן", updater.create_auto_session_summary)
+
+        # Write back everything the steps above changed, before backing up
+        # Run state is saved only after a successful write, so a failed write
+        # is retried on the next run instead of being skipped
+        if _safe_step("שמירת קבצים מעודכנים", updater.flush):
+            _safe_step("שמירת מצב ריצה", updater.save_state)
+        _safe_step("גיבוי מלא של הפרויקט ל-GitHub", updater.backup_to_github)
 
         # Generate final report
         updater.generate_final_report()
@@ -25,7 +25,7 @@ import re
 import sys
 from datetime import date, datetime
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 # Import GitHub Backup Manager
 sys.path.append(str(Path(__file__).parent.parent / "src"))
@@ -133,42 +133,6 @@ class AutoProjectUpdater:
 
         return activities[:3]  # Limit to 3 most recent
 
-    def analyze_git_commits(self) -> List[str]:
-        """ניתוח commit messages לזיהוי פעילויות"""
-        activities = []
-        try:
-            import subprocess
-            import os
-
-            # Change to project directory
-            original_dir = os.getcwd()
-            os.chdir(self.base_path)
-
-            # Get last 5 commits from today
-            today_str = date.today().strftime("%Y-%m-%d")
-            result = subprocess.run([
-                'git', 'log', '--oneline', '--since', today_str, '-n', '5'
-            ], capture_output=True, text=True, check=True)
-
-            if result.stdout.strip():
-                commits = result.stdout.strip().split('\n')
-                for commit in commits:
-                    if commit.strip():
-                        # Extract meaningful info from commit message
-                        commit_msg = commit.split(' ', 1)[1] if ' ' in commit else commit
-                        if any(keyword in commit_msg.lower() for keyword in
-                               ['add', 'create', 'update', 'fix', 'enhance', 'implement']):
-                            activities.append(f"Git: {commit_msg[:60]}")
-
-            os.chdir(original_dir)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # Git not available or no commits today
-            pass
-        except Exception:
-            pass
-
-        return activities[:3]  # Limit to 3 most recent
-
     def detect_session_activities(self) -> List[str]:
         """Auto-detect what was done in this session - ENHANCED"""
         activities = []
@@ -265,18 +229,6 @@ class AutoProjectUpdater:
                 except OSError:
                     pass
 
-        return file_analysis
-                                classes = re.findall(r'class\s+(\w+)', content)
-                                indicators.extend([f"class {cls}" for cls in classes[:3]])
-                            if 'def' in content.lower():
-                                functions = re.findall(r'def\s+(\w+)', content)
-                                main_functions = [f for f in functions if not f.startswith('_')][:3]
-                                indicators.extend([f"function {func}" for func in main_functions])
-
-                            file_analysis[py_file.name] = indicators
-                except OSError:
-                    pass
-
         return file_analysis
 
     def dynamic_task_matching(self, tasks_content: str) -> List[tuple]:
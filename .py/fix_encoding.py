@@ -4,37 +4,45 @@
 Fix encoding issues in TASKS.md - specifically Milestone 3.2 icons
 """
 
-import os
+import re
 from pathlib import Path
 
+# Replacements for Milestone 3.2
+REPLACEMENTS = {
+    "⏳ 🔥 התקנת database libraries:": "✅ 🟢 התקנת database libraries:",
+    "⏳ 🔥 יצירת Database Models:": "✅ 🟢 יצירת Database Models:",
+    "⏳ 🔥 יצירת Database Manager class:": "✅ 🟢 יצירת Database Manager class:",
+    "⏳ 🔥 מערכת migrations עם Alembic": "✅ 🟢 מערכת migrations עם Alembic",
+}
+# One alternation over all keys, so the file is scanned once
+REPLACEMENTS_RE = re.compile("|".join(re.escape(old) for old in REPLACEMENTS))
+
 def fix_tasks_encoding():
     """Fix the encoding issues with checkmarks in TASKS.md"""
 
     tasks_file = Path(r"C:\Users\Golan\Claude-Code\Trading Project\Trading Project 004\.md\TASKS.md")
 
     # Read with explicit UTF-8 encoding
-    with open(tasks_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Define replacements for Milestone 3.2
-    replacements = [
-        ("⏳ 🔥 התקנת database libraries:", "✅ 🟢 התקנת database libraries:"),
-        ("⏳ 🔥 יצירת Database Models:", "✅ 🟢 יצירת Database Models:"),
-        ("⏳ 🔥 יצירת Database Manager class:", "✅ 🟢 יצירת Database Manager class:"),
-        ("⏳ 🔥 מערכת migrations עם Alembic", "✅ 🟢 מערכת migrations עם Alembic")
-    ]
-
-    # Apply replacements
+    content = tasks_file.read_text(encoding='utf-8')
+
+    # Apply all replacements in a single pass
+    replaced = set()
+
+    def _replace(match):
+        replaced.add(match.group(0))
+        return REPLACEMENTS[match.group(0)]
+
+    content = REPLACEMENTS_RE.sub(_replace, content)
+
     changes_made = 0
-    for old_text, new_text in replacements:
-        if old_text in content:
-            content = content.replace(old_text, new_text)
+    for old_text in REPLACEMENTS:
+        if old_text in replaced:
             changes_made += 1
             print(f"Replaced: {old_text}")
 
-    # Write back with explicit UTF-8 encoding
-    with open(tasks_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Write back with explicit UTF-8 encoding - only if something changed
+    if changes_made:
+        tasks_file.write_text(content, encoding='utf-8')
 
     print(f"Fixed {changes_made} items in TASKS.md!")
     return True
@@ -4,82 +4,236 @@
 Project Status Reviewer - Trading Project 004
 Auto-generates project status summary from documentation files
 
-Usage: python project_status_reviewer.py
+Usage: python project_status_reviewer.py [--force]
 """
 
-# import os  # Not used currently
+import heapq
+import io
+import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Fix Windows console encoding issues
+# Fix Windows console encoding issues - switch the existing streams in place
 if sys.platform.startswith("win"):
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+    try:
+        sys.stdout.reconfigure(encoding="utf-8", errors="strict")
+        sys.stderr.reconfigure(encoding="utf-8", errors="strict")
+    except AttributeError:
+        # Streams replaced by something that isn't a TextIOWrapper
+        pass
+
+# Patterns for the parse_* methods, compiled once at import
+# CURRENT_STATUS.md fields
+_PHASE_RE = re.compile(r"\*\*Phase:\*\* (.+)")
+_PROGRESS_RE = re.compile(r"\*\*Progress:\*\* (.+)")
+_NEXT_ACTIONS_RE = re.compile(r"\*\*Next Actions:\*\* (.+)")
+_BLOCKERS_RE = re.compile(r"\*\*Current:\*\* (.+)")
+# TASKS.md task lines: status, priority and (looked ahead, not consumed) the
+# task text, so one scan yields both the counts and the task names
+_TASK_LINE_RE = re.compile(r"- ([✅⏳🔄]) ([🔥🟡🟢🔄])(?= (.+))?")
+_PRIORITIES = "🔥🟡🟢"
+# RULES.md numbered rule lines; the group is the rule text, limited to 120 chars
+_RULE_LINE_RE = re.compile(r"[1-6]\.\s*(.{0,120})")
+# Architectural-decision markers, one named group per marker so a single
+# finditer() over each document finds all of them
+_DB_DECISIONS_RE = re.compile(
+    r"(?P<sqlite>SQLite)|(?P<postgres>PostgreSQL)"
+    r"|(?P<dna>DNA Database)|(?P<long_only>LONG only)"
+)
+_PLANNING_DECISIONS_RE = re.compile(
+    r"(?P<ib>Interactive Brokers)|(?P<timeframes>(?i:5 timeframes))"
+)
+# SESSION_ARCHIVE.md sections
+_SESSION_RE = re.compile(r"### Session ([0-9/]+)")
+_ACCOMPLISHMENTS_RE = re.compile(r"\*\*Main Accomplishments:\*\*\s*\n((?:- .+\n?)*)")
+# Byte versions of the session patterns, used when the archive is memory-mapped
+_SESSION_BYTES_RE = re.compile(_SESSION_RE.pattern.encode())
+_ACCOMPLISHMENTS_BYTES_RE = re.compile(_ACCOMPLISHMENTS_RE.pattern.encode())
+# Literal prefixes of the session patterns, used to find the last match with rfind()
+_SESSION_MARKER = "### Session "
+_ACCOMPLISHMENTS_MARKER = "**Main Accomplishments:**"
+# Non-ASCII runs replaced by safe_print's fallback
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
+
+# Write buffer for GENERATED_STATUS_SUMMARY.md, large enough to save it in one go
+_IO_BUFFER_SIZE = 256 * 1024
+# Version of .reviewer_cache.json - bump whenever a cached parser's output
+# changes, so results saved by older code are discarded
+_PARSE_CACHE_VERSION = 1
+# Files whose raw text is still needed after reading; the rest are parsed
+# as soon as they are read and only the parsed result is kept
+_RAW_CONTENT_FILES = ("PLANNING.md", "DATABASE_DESIGN.md", "TASKS.md")
+# Files that are only scanned (never rewritten), parsed from a memory map
+_MAPPED_FILES = ("SESSION_ARCHIVE.md",)
+
+# Fixed parts of the generated summary, one tuple entry per output line
+_SUMMARY_HEADER = (
+    "=" * 60,
+    "🎯 TRADING PROJECT 004 - STATUS SUMMARY",
+    "=" * 60,
+    "",
+    # Add RULES enforcement reminder at the top
+    "⚠️ IMPORTANT - RULES ENFORCEMENT:",
+    "   📋 RULES.md has been read - MUST follow communication and work rules",
+    "   🔹 Communication: Short, direct, factual responses",
+    "   🔹 Work Process: Plan before action, request approval, no unsolicited code",
+    "   🔹 Resource Saving: Use efficient tools, batch operations",
+    "",
+)
+_SUMMARY_CONTEXT_NOTE = (
+    "📖 COMPLETE PROJECT CONTEXT:",
+    "   ⚡ This summary provides quick status overview",
+    "   📚 For full context, CLAUDE.md contains complete reading guidelines:",
+    "     • All project documentation (RULES, PRD, PLANNING, etc.)",
+    "     • Database design specifications (DATABASE_DESIGN.md)",
+    "     • Session history and accomplishments",
+    "   💡 Use this summary as starting point, refer to CLAUDE.md for details",
+    "",
+)
+_SUMMARY_FOOTER = (
+    "=" * 60,
+    "",
+    "🚨 CLAUDE CODE SESSION START REQUIREMENTS:",
+    "   1. APPLY RULES.md immediately - no exceptions",
+    "   2. Communicate: Short, direct, seek approval",
+    "   3. Work: Plan first, execute only after approval",
+    "=" * 60,
+)
+
+
+def safe_print(text):
+    """Print text safely handling encoding issues"""
+    try:
+        print(text)
+    except UnicodeEncodeError:
+        # Fallback: remove emojis and special characters
+        clean_text = _NON_ASCII_RE.sub("?", text)
+        print(clean_text)
 
 
 class ProjectStatusReviewer:
+    # Files to read in order
+    FILES_TO_READ = (
+        "RULES.md",
+        "PRD.md",
+        "PLANNING.md",
+        "DATABASE_DESIGN.md",
+        "CURRENT_STATUS.md",
+        "TASKS.md",
+        "SESSION_ARCHIVE.md",
+    )
+
     def __init__(self):
         # Define paths
         self.base_path = Path(__file__).parent.parent
         self.md_path = self.base_path / ".md"
 
-        # Files to read in order
-        self.files_to_read = [
-            "RULES.md",
-            "PRD.md",
-            "PLANNING.md",
-            "DATABASE_DESIGN.md",
-            "CURRENT_STATUS.md",
-            "TASKS.md",
-            "SESSION_ARCHIVE.md",
-        ]
-
         self.status_data = {}
 
+        # Parsed results from earlier runs, keyed by file name and reused
+        # while the file's (mtime_ns, size) is unchanged
+        self.cache_file = self.md_path / ".reviewer_cache.json"
+        self._parse_cache = self._load_parse_cache()
+        self._parse_cache_dirty = False
+
         # Additional data for enhanced summary
         self.project_rules = {}
         self.technical_status = {}
         self.architectural_decisions = []
 
-    def safe_print(self, text):
-        """Print text safely handling encoding issues"""
-        try:
-            print(text)
-        except UnicodeEncodeError:
-            # Fallback: remove emojis and special characters
-            import re
-
-            clean_text = re.sub(r"[^\x00-\x7F]+", "?", text)
-            print(clean_text)
+    # Printing needs no instance state - shared with main()'s error path
+    safe_print = staticmethod(safe_print)
 
     def read_file_safe(self, filename):
         """Safely read a file with UTF-8 encoding"""
         try:
-            file_path = self.md_path / filename
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
+            return (self.md_path / filename).read_text(encoding="utf-8")
         except FileNotFoundError:
             return f"❌ File {filename} not found"
         except Exception as e:
             return f"❌ Error reading {filename}: {str(e)}"
 
+    def _load_parse_cache(self):
+        """Load parsed results saved by the previous run (empty if unavailable)"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != _PARSE_CACHE_VERSION:
+            return {}  # Written by another version of the parsers
+        return cache.get("files", {})
+
+    def save_parse_cache(self):
+        """Write the parse cache back if this run added to it (atomic replace)"""
+        if not self._parse_cache_dirty:
+            return True
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": _PARSE_CACHE_VERSION, "files": self._parse_cache},
+                    f,
+                    ensure_ascii=False,
+                )
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            self.safe_print(f"❌ Error writing {self.cache_file}: {str(e)}")
+            return False
+        self._parse_cache_dirty = False
+        return True
+
+    def cached_parse(self, filename, parser, content=None):
+        """Run parser on a .md file, reusing the last result if the file is unchanged"""
+        try:
+            st = os.stat(self.md_path / filename)
+            key = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            key = None
+
+        entry = self._parse_cache.get(filename)
+        if key is not None and entry and entry.get("key") == key:
+            return entry["result"]
+
+        if content is None and filename in _MAPPED_FILES:
+            result = self.parse_mapped(filename, parser)
+        else:
+            if content is None:
+                content = self.read_file_safe(filename)
+            result = parser(content)
+        if key is not None:
+            self._parse_cache[filename] = {"key": key, "result": result}
+            self._parse_cache_dirty = True
+        return result
+
+    def parse_mapped(self, filename, parser):
+        """Run parser on a memory map of the file instead of its decoded text"""
+        try:
+            with open(self.md_path / filename, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return parser(mm)
+        except (OSError, ValueError):
+            # Missing or empty file - fall back to the regular text read
+            return parser(self.read_file_safe(filename))
+
     def parse_current_status(self, content):
         """Parse CURRENT_STATUS.md for key information"""
         try:
             # Extract phase
-            phase_match = re.search(r"\*\*Phase:\*\* (.+)", content)
+            phase_match = _PHASE_RE.search(content)
             phase = phase_match.group(1).strip() if phase_match else "Unknown"
 
             # Extract progress
-            progress_match = re.search(r"\*\*Progress:\*\* (.+)", content)
+            progress_match = _PROGRESS_RE.search(content)
             progress = progress_match.group(1).strip() if progress_match else "Unknown"
 
             # Extract next actions
-            next_actions_match = re.search(r"\*\*Next Actions:\*\* (.+)", content)
+            next_actions_match = _NEXT_ACTIONS_RE.search(content)
             next_actions = (
                 next_actions_match.group(1).strip()
                 if next_actions_match
@@ -87,7 +241,7 @@ class ProjectStatusReviewer:
             )
 
             # Extract blockers
-            blockers_match = re.search(r"\*\*Current:\*\* (.+)", content)
+            blockers_match = _BLOCKERS_RE.search(content)
             blockers = blockers_match.group(1).strip() if blockers_match else "None"
 
             return {
@@ -101,21 +255,31 @@ class ProjectStatusReviewer:
 
     def parse_tasks_status(self, content):
         """Parse TASKS.md for completed and next tasks"""
+        # NOTE: Do not wrap in Numba's @njit - its string ops are slower than
+        # CPython's and the compile cost outweighs a once-per-session run
         try:
-            # Count completed tasks (excluding legend items) - fixed regex pattern
-            completed_tasks = len(re.findall(r"- ✅ [🔥🟡🟢🔄]", content))
-            pending_tasks = len(re.findall(r"- ⏳ [🔥🟡🟢]", content))
-            in_progress_tasks = len(re.findall(r"- 🔄 [🔥🟡🟢]", content))
-
-            # Find last completed task (real tasks, not legend)
-            completed_matches = re.findall(r"- ✅ [🔥🟡🟢] (.+)", content)
-            last_completed = (
-                completed_matches[-1].strip() if completed_matches else "None found"
-            )
-
-            # Find next pending task (real tasks, not legend)
-            pending_matches = re.findall(r"- ⏳ [🔥🟡🟢] (.+)", content)
-            next_task = pending_matches[0].strip() if pending_matches else "None found"
+            completed_tasks = pending_tasks = in_progress_tasks = 0
+            last_completed = next_task = None
+
+            # Single pass over all task lines (legend items have no priority)
+            for task_match in _TASK_LINE_RE.finditer(content):
+                status, priority, text = task_match.groups()
+                if status == "✅":
+                    completed_tasks += 1  # 🔄 priority still counts as completed
+                    # Last completed task (real tasks, not legend)
+                    if text is not None and priority in _PRIORITIES:
+                        last_completed = text
+                elif priority in _PRIORITIES:
+                    if status == "⏳":
+                        pending_tasks += 1
+                        # Next pending task (real tasks, not legend)
+                        if next_task is None and text is not None:
+                            next_task = text
+                    else:
+                        in_progress_tasks += 1
+
+            last_completed = last_completed.strip() if last_completed else "None found"
+            next_task = next_task.strip() if next_task else "None found"
 
             return {
                 "completed_count": completed_tasks,
@@ -135,27 +299,25 @@ class ProjectStatusReviewer:
         }
 
         current_section = None
-        for line in rules_content.split('\n'):
+        # Iterate lines lazily instead of materializing split('\n')
+        for line in io.StringIO(rules_content):
             line = line.strip()
             if "חוקי תקשורת" in line:
                 current_section = "communication"
             elif "חוקי עבודה" in line:
                 current_section = "work_process"
-            elif line.startswith(('1.', '2.', '3.', '4.', '5.', '6.')):
-                if current_section:
-                    # Extract rule text, clean it up
-                    rule_text = line[2:].strip()[:120]  # Limit length
-                    rules[current_section].append(rule_text)
+            elif current_section:
+                # Numbered rule - the match extracts the cleaned, length-limited text
+                rule_match = _RULE_LINE_RE.match(line)
+                if rule_match:
+                    rules[current_section].append(rule_match.group(1))
 
         return rules
 
-    def extract_technical_status(self):
+    def extract_technical_status(self, python_files=None):
         """Extract current technical status and dependencies"""
-        src_path = self.base_path / "src"
-        python_files = []
-
-        if src_path.exists():
-            python_files = [f.name for f in src_path.glob("*.py")]
+        if python_files is None:
+            python_files = self._scan_src_once()[0]
 
         # Check for key technology decisions from various files
         tech_status = {
@@ -168,46 +330,78 @@ class ProjectStatusReviewer:
 
         return tech_status
 
+    @staticmethod
+    def _find_markers(pattern, content):
+        """Names of the pattern's groups that occur in content, in one scan"""
+        found = set()
+        for marker_match in pattern.finditer(content):
+            found.add(marker_match.lastgroup)
+            if len(found) == pattern.groups:
+                break  # Every marker seen - no need to scan further
+        return found
+
     def extract_architectural_decisions(self, content_dict):
         """Extract key architectural decisions from documentation"""
         decisions = []
 
         # From DATABASE_DESIGN.md
         if "DATABASE_DESIGN.md" in content_dict:
-            db_content = content_dict["DATABASE_DESIGN.md"]
-            if "SQLite" in db_content and "PostgreSQL" in db_content:
+            found = self._find_markers(_DB_DECISIONS_RE, content_dict["DATABASE_DESIGN.md"])
+            if "sqlite" in found and "postgres" in found:
                 decisions.append("Database: SQLite for development, PostgreSQL for production")
-            if "DNA Database" in db_content:
+            if "dna" in found:
                 decisions.append("DNA Database: Every minute with trading simulation + indicators")
-            if "LONG only" in db_content:
+            if "long_only" in found:
                 decisions.append("Trading Strategy: LONG only, SL=$2.8, TP=$3.2, 50 shares")
 
         # From PLANNING.md
         if "PLANNING.md" in content_dict:
-            planning_content = content_dict["PLANNING.md"]
-            if "Interactive Brokers" in planning_content:
+            found = self._find_markers(_PLANNING_DECISIONS_RE, content_dict["PLANNING.md"])
+            if "ib" in found:
                 decisions.append("Data Source: Interactive Brokers API with enterprise validation")
-            if "5 timeframes" in planning_content.lower():
+            if "timeframes" in found:
                 decisions.append("Multi-timeframe: 5 timeframes for comprehensive analysis")
 
         return decisions
 
+    @staticmethod
+    def _last_match(pattern, marker, content):
+        """Last match of a pattern that starts with marker, found with rfind() from the end"""
+        pos = content.rfind(marker)
+        while pos >= 0:
+            found = pattern.match(content, pos)
+            if found:
+                return found
+            pos = content.rfind(marker, 0, pos)
+        return None
+
     def parse_session_archive(self, content):
         """Parse SESSION_ARCHIVE.md for latest session info"""
         try:
-            # Find the latest session (last one in the archive)
-            all_sessions = re.findall(r"### Session ([0-9/]+)", content)
-            latest_session = all_sessions[-1] if all_sessions else "No sessions found"
+            # content may be text or a memory map of the file; with bytes only
+            # the matched fields are decoded
+            if isinstance(content, str):
+                session_re, accomplishments_re = _SESSION_RE, _ACCOMPLISHMENTS_RE
+                session_marker, accomplishments_marker = _SESSION_MARKER, _ACCOMPLISHMENTS_MARKER
+            else:
+                session_re, accomplishments_re = _SESSION_BYTES_RE, _ACCOMPLISHMENTS_BYTES_RE
+                session_marker = _SESSION_MARKER.encode()
+                accomplishments_marker = _ACCOMPLISHMENTS_MARKER.encode()
+
+            # Find the latest session (last one in the archive), searching
+            # backwards from the end instead of matching every session
+            session_match = self._last_match(session_re, session_marker, content)
+            latest_session = session_match.group(1) if session_match else "No sessions found"
+            if isinstance(latest_session, bytes):
+                latest_session = latest_session.decode("utf-8")
 
             # Extract major accomplishments from latest session (last section)
-            accomplishments_sections = re.findall(
-                r"\*\*Main Accomplishments:\*\*\s*\n((?:- .+\n?)*)", content
-            )
-            accomplishments_section = (
-                accomplishments_sections[-1] if accomplishments_sections else None
-            )
+            section_match = self._last_match(accomplishments_re, accomplishments_marker, content)
+            accomplishments_section = section_match.group(1) if section_match else None
 
             if accomplishments_section:
+                if isinstance(accomplishments_section, bytes):
+                    accomplishments_section = accomplishments_section.decode("utf-8", "replace")
                 accomplishments = accomplishments_section.strip()
                 # Take first 2 accomplishments
                 accomplishment_lines = [
@@ -224,27 +418,44 @@ class ProjectStatusReviewer:
         except Exception as e:
             return {"error": f"Failed to parse SESSION_ARCHIVE.md: {str(e)}"}
 
-    def scan_python_files(self):
-        """Scan src/ directory for Python files and their status"""
-        src_path = self.base_path / "src"
+    def _scan_src_once(self):
+        """List src/*.py in one directory pass: (all names, per-file info without __init__.py)"""
+        names = []
         python_files = {}
 
-        if src_path.exists():
-            for py_file in src_path.glob("*.py"):
-                if py_file.name != "__init__.py":  # Skip __init__.py
-                    stat = py_file.stat()
-                    python_files[py_file.name] = {
+        # DirEntry.stat() reuses what the directory listing already fetched
+        try:
+            with os.scandir(self.base_path / "src") as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith(".py") or not entry.is_file():
+                        continue
+                    names.append(name)
+                    if name == "__init__.py":  # Skip __init__.py
+                        continue
+                    stat = entry.stat()
+                    python_files[name] = {
                         'exists': True,
                         'size': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
+                        'mtime': stat.st_mtime  # formatted only for the files shown
                     }
+        except OSError:
+            pass
+
+        return names, python_files
 
-        return python_files
+    def scan_python_files(self):
+        """Scan src/ directory for Python files and their status"""
+        return self._scan_src_once()[1]
 
     def analyze_task_completion(self, tasks_content, python_files):
         """Analyze which tasks should be marked as completed based on existing files"""
         updates_made = []
 
+        # Nothing pending - skip the line walk entirely
+        if '- ⏳' not in tasks_content and '- 🔄' not in tasks_content:
+            return tasks_content, updates_made
+
         # Define file-to-task mappings
         file_mappings = {
             'database_models.py': ['Database Models', 'HistoricalData model'],
@@ -264,6 +475,14 @@ class ProjectStatusReviewer:
         # Keywords for task completion detection
         completion_keywords = ['יצירת', 'עדכון', 'התקנת', 'בדיקת', 'הקמת', 'פיתוח']
 
+        # Flatten the mappings once, keeping only files that actually exist
+        active = [
+            (keyword.lower(), filename, keyword)
+            for filename, keywords in file_mappings.items()
+            if filename in python_files and python_files[filename]['exists']
+            for keyword in keywords
+        ]
+
         # Look for tasks that should be completed
         lines = tasks_content.split('\n')
         updated_lines = []
@@ -271,27 +490,23 @@ class ProjectStatusReviewer:
         for line in lines:
             updated_line = line
             # Check if this is a pending task line
-            if '- ⏳' in line or '- 🔄' in line:
+            # Position of the pending marker (-1 if none); found once and
+            # reused for the replacement below
+            pos = -1
+            if active:
+                pos = line.find('- ⏳')
+                if pos < 0:
+                    pos = line.find('- 🔄')
+            if pos >= 0:
                 task_text = line.lower()
-                should_complete = False
 
                 # Check file-based completion
-                for filename, keywords in file_mappings.items():
-                    if filename in python_files and python_files[filename]['exists']:
-                        for keyword in keywords:
-                            if keyword.lower() in task_text:
-                                should_complete = True
-                                updates_made.append(f"Found {filename} → completing task: {keyword}")
-                                break
-                    if should_complete:
-                        break
+                hit = next((entry for entry in active if entry[0] in task_text), None)
 
                 # Update the line if task should be completed
-                if should_complete:
-                    if '- ⏳' in line:
-                        updated_line = line.replace('- ⏳', '- ✅')
-                    elif '- 🔄' in line:
-                        updated_line = line.replace('- 🔄', '- ✅')
+                if hit:
+                    updates_made.append(f"Found {hit[1]} → completing task: {hit[2]}")
+                    updated_line = line[:pos] + '- ✅' + line[pos + 3:]
 
             updated_lines.append(updated_line)
 
@@ -300,9 +515,7 @@ class ProjectStatusReviewer:
     def update_tasks_file(self, updated_content):
         """Write updated TASKS.md back to file"""
         try:
-            tasks_file = self.md_path / "TASKS.md"
-            with open(tasks_file, 'w', encoding='utf-8') as f:
-                f.write(updated_content)
+            (self.md_path / "TASKS.md").write_text(updated_content, encoding='utf-8')
             return True
         except Exception as e:
             self.safe_print(f"❌ Error updating TASKS.md: {str(e)}")
@@ -310,16 +523,44 @@ class ProjectStatusReviewer:
 
     def analyze_project(self):
         """Main analysis function with enhanced file scanning"""
-        self.safe_print("🔍 Reading project documentation files...")
+        # Files parsed straight from their content as they are read
+        parsers = {
+            "RULES.md": self.extract_project_rules,
+            "CURRENT_STATUS.md": self.parse_current_status,
+            "SESSION_ARCHIVE.md": self.parse_session_archive,
+        }
+        parsed = {}
+
+        def load(filename):
+            if filename in parsers:
+                return self.cached_parse(filename, parsers[filename])
+            return self.read_file_safe(filename)
+
+        # Only files whose content is used are read (PRD.md is listed for
+        # context only)
+        to_load = [
+            filename for filename in self.FILES_TO_READ
+            if filename in parsers or filename in _RAW_CONTENT_FILES
+        ]
 
-        # Read all files - ACTUAL CONTENT READING
-        for filename in self.files_to_read:
-            self.safe_print(f"   📄 Reading {filename}...")
-            content = self.read_file_safe(filename)
-            self.status_data[filename] = content
+        # One console write for the whole file list, before the reads start
+        self.safe_print("\n".join(
+            ["🔍 Reading project documentation files..."]
+            + [f"   📄 Reading {filename}..." for filename in to_load]
+        ))
+
+        # Read all files - ACTUAL CONTENT READING (unchanged files that have a
+        # cached parse result are not read again). The reads run concurrently.
+        with ThreadPoolExecutor(max_workers=len(to_load)) as executor:
+            results = executor.map(load, to_load)
+            for filename, result in zip(to_load, results):
+                if filename in parsers:
+                    parsed[filename] = result
+                elif filename in _RAW_CONTENT_FILES:
+                    self.status_data[filename] = result
 
         self.safe_print("\n📊 Scanning Python files in src/...")
-        python_files = self.scan_python_files()
+        src_names, python_files = self._scan_src_once()
         self.safe_print(f"   Found {len(python_files)} Python files")
 
         self.safe_print("\n🔄 Analyzing task completion status...")
@@ -346,107 +587,129 @@ class ProjectStatusReviewer:
         self.safe_print("\n📊 Analyzing project status...")
 
         # Extract enhanced information
-        if "RULES.md" in self.status_data:
-            self.project_rules = self.extract_project_rules(self.status_data["RULES.md"])
+        if "RULES.md" in parsed:
+            self.project_rules = parsed["RULES.md"]
 
-        self.technical_status = self.extract_technical_status()
+        self.technical_status = self.extract_technical_status(src_names)
         self.architectural_decisions = self.extract_architectural_decisions(self.status_data)
 
-        # Parse specific files
-        current_status = self.parse_current_status(
-            self.status_data.get("CURRENT_STATUS.md", "")
-        )
-        task_status = self.parse_tasks_status(self.status_data.get("TASKS.md", ""))
-        session_info = self.parse_session_archive(
-            self.status_data.get("SESSION_ARCHIVE.md", "")
+        # Parse specific files - TASKS.md last, after any automatic updates
+        current_status = parsed.get("CURRENT_STATUS.md") or self.parse_current_status("")
+        task_status = self.cached_parse(
+            "TASKS.md", self.parse_tasks_status, self.status_data.get("TASKS.md", "")
         )
+        session_info = parsed.get("SESSION_ARCHIVE.md") or self.parse_session_archive("")
+
+        self.save_parse_cache()
 
         return current_status, task_status, session_info, python_files
 
+    def summary_is_current(self, output_file):
+        """True if output_file is newer than this script, every source .md file and src/"""
+        try:
+            out_mtime = os.stat(output_file).st_mtime_ns
+            # A change to the parsers or the summary layout also makes it stale
+            latest = os.stat(__file__).st_mtime_ns
+        except OSError:
+            return False
+
+        for filename in self.FILES_TO_READ:
+            try:
+                latest = max(latest, os.stat(self.md_path / filename).st_mtime_ns)
+            except OSError:
+                pass
+
+        src_path = self.base_path / "src"
+        try:
+            # The directory's own mtime covers added and removed files
+            latest = max(latest, os.stat(src_path).st_mtime_ns)
+            with os.scandir(src_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py") and entry.is_file():
+                        latest = max(latest, entry.stat().st_mtime_ns)
+        except OSError:
+            pass
+
+        return out_mtime > latest
+
     def generate_summary(self, current_status, task_status, session_info, python_files=None):
         """Generate final summary with RULES enforcement reminder"""
-        summary = []
-        summary.append("=" * 60)
-        summary.append("🎯 TRADING PROJECT 004 - STATUS SUMMARY")
-        summary.append("=" * 60)
-        summary.append("")
+        generated_at = f"{datetime.now():%Y-%m-%d %H:%M:%S}"
 
-        # Add RULES enforcement reminder at the top
-        summary.append("⚠️ IMPORTANT - RULES ENFORCEMENT:")
-        summary.append("   📋 RULES.md has been read - MUST follow communication and work rules")
-        summary.append("   🔹 Communication: Short, direct, factual responses")
-        summary.append("   🔹 Work Process: Plan before action, request approval, no unsolicited code")
-        summary.append("   🔹 Resource Saving: Use efficient tools, batch operations")
-        summary.append("")
+        # Fixed blocks are module-level tuples; each dynamic section is added
+        # with one extend() instead of an append() per line
+        summary = list(_SUMMARY_HEADER)
 
         # Session info
-        summary.append("📝 LATEST SESSION:")
-        summary.append(f"   Date: {session_info.get('latest_session', 'Unknown')}")
-        for accomplishment in session_info.get("key_accomplishments", [])[:2]:
-            if accomplishment:
-                summary.append(f"   • {accomplishment}")
-        summary.append("")
-
-        # Current state
-        summary.append("📋 CURRENT STATE:")
-        summary.append(f"   Phase: {current_status.get('phase', 'Unknown')}")
-        summary.append(f"   Progress: {current_status.get('progress', 'Unknown')}")
-        summary.append(f"   Blockers: {current_status.get('blockers', 'Unknown')}")
-        summary.append("")
-
-        # Task status
-        summary.append("✅ TASK STATUS:")
-        summary.append(f"   Completed: {task_status.get('completed_count', 0)} tasks")
-        summary.append(f"   Pending: {task_status.get('pending_count', 0)} tasks")
-        summary.append(
-            f"   In Progress: {task_status.get('in_progress_count', 0)} tasks"
+        summary.extend([
+            "📝 LATEST SESSION:",
+            f"   Date: {session_info.get('latest_session', 'Unknown')}",
+        ])
+        summary.extend(
+            f"   • {accomplishment}"
+            for accomplishment in session_info.get("key_accomplishments", [])[:2]
+            if accomplishment
         )
         summary.append("")
 
-        # Last completed task
-        summary.append("🏁 LAST COMPLETED:")
-        last_completed = task_status.get("last_completed", "None")[
-            :80
-        ]  # Truncate if too long
-        summary.append(f"   {last_completed}")
-        summary.append("")
-
-        # Next task
-        summary.append("🔜 NEXT TASK:")
+        last_completed = task_status.get("last_completed", "None")[:80]  # Truncate if too long
         next_task = task_status.get("next_task", "None")[:80]  # Truncate if too long
-        summary.append(f"   {next_task}")
-        summary.append("")
-
-        # Next actions
-        summary.append("🎯 NEXT ACTIONS:")
-        summary.append(f"   {current_status.get('next_actions', 'Not specified')}")
-        summary.append("")
-
-        # Project Rules (NEW)
-        summary.append("📋 PROJECT RULES:")
-        summary.append("   📞 Communication Rules:")
-        for rule in self.project_rules.get("communication", [])[:3]:  # Limit to top 3
-            summary.append(f"     • {rule}")
+        summary.extend([
+            # Current state
+            "📋 CURRENT STATE:",
+            f"   Phase: {current_status.get('phase', 'Unknown')}",
+            f"   Progress: {current_status.get('progress', 'Unknown')}",
+            f"   Blockers: {current_status.get('blockers', 'Unknown')}",
+            "",
+            # Task status
+            "✅ TASK STATUS:",
+            f"   Completed: {task_status.get('completed_count', 0)} tasks",
+            f"   Pending: {task_status.get('pending_count', 0)} tasks",
+            f"   In Progress: {task_status.get('in_progress_count', 0)} tasks",
+            "",
+            # Last completed task
+            "🏁 LAST COMPLETED:",
+            f"   {last_completed}",
+            "",
+            # Next task
+            "🔜 NEXT TASK:",
+            f"   {next_task}",
+            "",
+            # Next actions
+            "🎯 NEXT ACTIONS:",
+            f"   {current_status.get('next_actions', 'Not specified')}",
+            "",
+            # Project Rules (NEW)
+            "📋 PROJECT RULES:",
+            "   📞 Communication Rules:",
+        ])
+        summary.extend(
+            f"     • {rule}" for rule in self.project_rules.get("communication", [])[:3]  # Limit to top 3
+        )
         summary.append("   💼 Work Process Rules:")
-        for rule in self.project_rules.get("work_process", [])[:3]:  # Limit to top 3
-            summary.append(f"     • {rule}")
-        summary.append("")
+        summary.extend(
+            f"     • {rule}" for rule in self.project_rules.get("work_process", [])[:3]  # Limit to top 3
+        )
 
         # Technical Status (ENHANCED)
-        summary.append("🔧 TECHNICAL STATUS:")
-        summary.append(f"   Environment: {self.technical_status.get('environment', 'Unknown')}")
-        summary.append(f"   Database: {self.technical_status.get('database_choice', 'Not specified')}")
-        summary.append(f"   Validation: {self.technical_status.get('validation_quality', 'Unknown')}")
+        summary.extend([
+            "",
+            "🔧 TECHNICAL STATUS:",
+            f"   Environment: {self.technical_status.get('environment', 'Unknown')}",
+            f"   Database: {self.technical_status.get('database_choice', 'Not specified')}",
+            f"   Validation: {self.technical_status.get('validation_quality', 'Unknown')}",
+        ])
 
         # Python Files Status (NEW)
         if python_files:
             summary.append(f"   Python Files: {len(python_files)} files in src/")
             summary.append("     Recent files:")
-            # Sort by modification time and show top 5
-            sorted_files = sorted(python_files.items(), key=lambda x: x[1]['modified'], reverse=True)
-            for filename, info in sorted_files[:5]:
+            # Top 5 by modification time - only those are ordered, not every file
+            recent_files = heapq.nlargest(5, python_files.items(), key=lambda x: x[1]['mtime'])
+            for filename, info in recent_files:
                 size_kb = info['size'] // 1024 if info['size'] > 0 else 0
-                summary.append(f"       • {filename} ({size_kb}KB, modified: {info['modified']})")
+                modified = datetime.fromtimestamp(info['mtime']).strftime('%Y-%m-%d %H:%M')
+                summary.append(f"       • {filename} ({size_kb}KB, modified: {modified})")
         else:
             summary.append(f"   Python Files: {len(self.technical_status.get('python_files', []))} files in src/")
             if self.technical_status.get('python_files'):
@@ -457,31 +720,19 @@ class ProjectStatusReviewer:
         # Architectural Decisions (NEW)
         if self.architectural_decisions:
             summary.append("🏗️ KEY ARCHITECTURAL DECISIONS:")
-            for decision in self.architectural_decisions[:4]:  # Limit to top 4
-                summary.append(f"   • {decision}")
+            summary.extend(
+                f"   • {decision}" for decision in self.architectural_decisions[:4]  # Limit to top 4
+            )
             summary.append("")
 
         # CLAUDE.md Integration Note (NEW)
-        summary.append("📖 COMPLETE PROJECT CONTEXT:")
-        summary.append("   ⚡ This summary provides quick status overview")
-        summary.append("   📚 For full context, CLAUDE.md contains complete reading guidelines:")
-        summary.append("     • All project documentation (RULES, PRD, PLANNING, etc.)")
-        summary.append("     • Database design specifications (DATABASE_DESIGN.md)")
-        summary.append("     • Session history and accomplishments")
-        summary.append("   💡 Use this summary as starting point, refer to CLAUDE.md for details")
-        summary.append("")
-
-        summary.append("=" * 60)
-        summary.append(f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        summary.append("=" * 60)
-        summary.append("")
-
+        summary.extend(_SUMMARY_CONTEXT_NOTE)
+        summary.extend([
+            "=" * 60,
+            f"📅 Generated: {generated_at}",
+        ])
         # Add final RULES reminder
-        summary.append("🚨 CLAUDE CODE SESSION START REQUIREMENTS:")
-        summary.append("   1. APPLY RULES.md immediately - no exceptions")
-        summary.append("   2. Communicate: Short, direct, seek approval")
-        summary.append("   3. Work: Plan first, execute only after approval")
-        summary.append("=" * 60)
+        summary.extend(_SUMMARY_FOOTER)
 
         return "\n".join(summary)
 
@@ -504,44 +755,39 @@ def main():
         reviewer.safe_print("🚀 Trading Project 004 - Status Reviewer")
         reviewer.safe_print("=" * 50)
 
-        # Analyze project with enhanced scanning
-        current_status, task_status, session_info, python_files = reviewer.analyze_project()
+        output_file = reviewer.base_path / ".md" / "GENERATED_STATUS_SUMMARY.md"
 
-        # Generate and display summary
-        summary = reviewer.generate_summary(current_status, task_status, session_info, python_files)
-        reviewer.safe_print(summary)
+        # Nothing changed since the last summary - show it instead of rebuilding
+        if "--force" not in sys.argv[1:] and reviewer.summary_is_current(output_file):
+            reviewer.safe_print(output_file.read_text(encoding="utf-8"))
+            reviewer.safe_print(f"\n✅ Summary up to date: {output_file} (use --force to regenerate)")
+        else:
+            # Analyze project with enhanced scanning
+            current_status, task_status, session_info, python_files = reviewer.analyze_project()
 
-        # Optionally save to file
-        output_file = reviewer.base_path / ".md" / "GENERATED_STATUS_SUMMARY.md"
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(summary)
+            # Generate and display summary
+            summary = reviewer.generate_summary(current_status, task_status, session_info, python_files)
+            reviewer.safe_print(summary)
 
-        reviewer.safe_print(f"\n💾 Full summary saved to: {output_file}")
+            # Optionally save to file
+            with open(output_file, "w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as f:
+                f.write(summary)
+
+            reviewer.safe_print(f"\n💾 Full summary saved to: {output_file}")
 
         # Add Claude reading instructions
         reviewer.safe_print("\n" + "=" * 60)
         reviewer.safe_print("📋 CLAUDE: Please read these files for complete project context:")
         reviewer.safe_print("=" * 60)
-        files_to_read = [
-            "RULES.md",
-            "PRD.md",
-            "PLANNING.md",
-            "DATABASE_DESIGN.md",
-            "CURRENT_STATUS.md",
-            "TASKS.md",
-            "GENERATED_STATUS_SUMMARY.md"
-        ]
-
-        for file in files_to_read:
+        for file in reviewer.FILES_TO_READ + ("GENERATED_STATUS_SUMMARY.md",):
             reviewer.safe_print(f"   📄 Read: {file}")
 
         reviewer.safe_print("\n💡 After reading these files, you'll have complete project understanding!")
         reviewer.safe_print("=" * 60)
 
     except Exception as e:
-        reviewer = ProjectStatusReviewer()
-        reviewer.safe_print(f"❌ Unexpected error: {str(e)}")
-        reviewer.safe_print("   Please check your file structure and try again.")
+        safe_print(f"❌ Unexpected error: {str(e)}")
+        safe_print("   Please check your file structure and try again.")
 
 
 if __name__ == "__main__":